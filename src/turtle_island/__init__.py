@@ -9,7 +9,7 @@ from .exprs.general import (
     move_cols_to_end,
     move_cols_to_start,
 )
-from .exprs.html import make_hyperlink, make_tooltip
+from .exprs.html import make_hyperlink, make_hyperlinks, make_tooltip
 
 __version__ = "0.0.10"
 
@@ -28,4 +28,5 @@ __all__ = [
     "make_concat_str",
     "make_tooltip",
     "make_hyperlink",
+    "make_hyperlinks",
 ]
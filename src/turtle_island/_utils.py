@@ -1,4 +1,5 @@
 import datetime
+import functools
 import uuid
 from collections.abc import Iterable
 from typing import Any, Collection, TypeVar
@@ -7,9 +8,44 @@ import polars as pl
 
 T = TypeVar("T")
 
+# Python scalar types whose Polars dtype Polars already infers natively
+# (`bool` must stay ahead of `int` lookups since `type()` is exact here).
+_PY_TO_PL: dict[type, Any] = {
+    bool: pl.Boolean,
+    int: pl.Int64,
+    float: pl.Float64,
+    str: pl.String,
+}
+
+# scalar-type -> dtype dispatch for `_cast_datatype()`; insertion order
+# doubles as the resolution order for the subclass fallback
+# (`datetime` must stay ahead of `date`)
+_CAST_DISPATCH: dict[type, Any] = {
+    **_PY_TO_PL,
+    datetime.datetime: pl.Datetime,
+    datetime.date: pl.Date,
+    datetime.time: pl.Time,
+    datetime.timedelta: pl.Duration,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _litify_cached(
+    keyed_items: tuple[tuple[type, Any], ...],
+) -> tuple[pl.Expr, ...]:
+    _lit = pl.lit
+    return tuple(_lit(item) for _, item in keyed_items)
+
 
 def _litify(items: Collection[Any]) -> list[pl.Expr]:
-    return [pl.lit(item) for item in items]
+    try:
+        # each value carries its type in the key: Python hashes
+        # True == 1 == 1.0 as equal, so values alone would collide
+        return list(_litify_cached(tuple((type(i), i) for i in items)))
+    except TypeError:
+        # unhashable items (e.g. lists)
+        _lit = pl.lit
+        return [_lit(item) for item in items]
 
 
 def _get_unique_name(n: int = 10) -> str:
@@ -20,34 +56,33 @@ def _get_unique_name(n: int = 10) -> str:
     return uuid.uuid4().hex[:n]
 
 
-def _cast_datatype(expr: pl.Expr, item: Any) -> pl.Expr:
+def _cast_datatype(
+    expr: pl.Expr, item: Any, current_dtype: Any = None
+) -> pl.Expr:
     """
     Cast a Polars expression to match the type of the given item.
 
     This utility is used internally by `bucketize()` to ensure
     the expression is cast to the appropriate type based on the
-    provided value.
+    provided value. When the caller already knows the expression's
+    dtype, passing it as `current_dtype` skips the cast node entirely
+    if it would be an identity map.
     """
-    # order matters
-    if item is True or item is False:
-        return expr.cast(pl.Boolean)
-    elif isinstance(item, datetime.datetime):
-        return expr.cast(pl.Datetime)
-    elif isinstance(item, datetime.date):
-        return expr.cast(pl.Date)
-    elif isinstance(item, datetime.time):
-        return expr.cast(pl.Time)
-    elif isinstance(item, datetime.timedelta):
-        return expr.cast(pl.Duration)
-    elif isinstance(item, int):
-        return expr.cast(pl.Int64)
-    elif isinstance(item, float):
-        return expr.cast(pl.Float64)
-    elif isinstance(item, str):
-        return expr.cast(pl.String)
+    # exact-type lookup covers every scalar on the hot path with a single
+    # hash probe instead of walking an `isinstance` ladder
+    dtype = _CAST_DISPATCH.get(type(item))
+    if dtype is not None:
+        if current_dtype is not None and current_dtype == dtype:
+            return expr
+        return expr.cast(dtype)
     # TODO: Is it possible to cast dict -> pl.Struct here?
-    elif isinstance(item, (list, tuple)):
+    if isinstance(item, (list, tuple)):
         return pl.list(expr)
+    # subclasses miss the exact-type table; fall back to `isinstance`
+    # in dispatch order
+    for py_type, pl_dtype in _CAST_DISPATCH.items():
+        if isinstance(item, py_type):
+            return expr.cast(pl_dtype)
     return expr
 
 
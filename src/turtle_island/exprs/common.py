@@ -1,3 +1,4 @@
+import functools
 from collections.abc import Iterable
 from typing import Sequence, overload
 
@@ -39,6 +40,17 @@ def case_when(
     `pl.when()`—is not supported in this function.
     :::
 
+    ::: {.callout-tip collapse="true"}
+    ### All branches are evaluated
+
+    Like `pl.when().then()` itself, every `then` expression is evaluated over
+    the full column before the conditions mask the results. For mutually
+    exclusive partitions driven by the row index, prefer
+    [bucketize()](bucketize.html#turtle_island.bucketize) /
+    [bucketize_lit()](bucketize_lit.html#turtle_island.bucketize_lit), which
+    lower to a single lookup.
+    :::
+
     Parameters
     ----------
     case_list
@@ -137,23 +149,36 @@ def case_when(
     ```
     """
 
-    from polars.expr.whenthen import Then
+    from polars.expr.whenthen import ChainedThen, Then
+
+    if not case_list:
+        if otherwise is None:
+            raise ValueError("`case_list=` must contain at least one case.")
+        # nothing to branch on: the fallback is the whole expression
+        return otherwise
 
     first_case, *cases = case_list
 
     # first
     *first_whens, first_then = first_case
-    expr: Then = pl.when(*first_whens).then(first_then)
-
-    # middles
-    for case in cases:
+    if not cases:
+        # single-case fast path: skip the loop setup entirely
+        return pl.when(*first_whens).then(first_then).otherwise(otherwise)
+
+    # fold the middle cases onto the chain in one pass; the first link is
+    # a `Then` and every later one a `ChainedThen`
+    def _chain(
+        acc: Then | ChainedThen,
+        case: tuple[pl.Expr | tuple[pl.Expr], pl.Expr],
+    ) -> ChainedThen:
         *whens, then = case
-        expr: Then = expr.when(*whens).then(then)  # type: ignore[no-redef]
+        return acc.when(*whens).then(then)
 
-    # last
-    expr: pl.Expr = expr.otherwise(otherwise)  # type: ignore[no-redef]
+    first_link: Then | ChainedThen = pl.when(*first_whens).then(first_then)
+    expr = functools.reduce(_chain, cases, first_link)
 
-    return expr
+    # last
+    return expr.otherwise(otherwise)
 
 
 @overload
@@ -5,6 +5,10 @@ __all__ = [
 ]
 
 
+# immutable, so one shared instance can back every index helper
+_INDEX_EXPR: pl.Expr = pl.int_range(0, pl.len(), dtype=pl.UInt32)
+
+
 def _make_index(start: int, end: int | pl.Expr) -> pl.Expr:
     return pl.int_range(start, end, dtype=pl.UInt32)
 
@@ -46,4 +50,8 @@ def make_index(offset: int = 0, *, name: str = "index") -> pl.Expr:
     df.select(ti.make_index(), pl.all())
     ```
     """
-    return _make_index(0, pl.len()).add(offset).alias(name)
+    if offset == 0:
+        # the dominant case: no need for an `add` node the optimizer
+        # would only have to fold away
+        return _INDEX_EXPR.alias(name)
+    return _INDEX_EXPR.add(offset).alias(name)
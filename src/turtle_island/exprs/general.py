@@ -1,12 +1,22 @@
-from collections.abc import Collection, Iterable
-from typing import Any
+from __future__ import annotations
+
+import functools
+from collections.abc import Collection, Iterable, Mapping
+from typing import TYPE_CHECKING, Any
 
 import polars as pl
-from polars._typing import PolarsDataType
+import polars.selectors as cs
+
+if TYPE_CHECKING:
+    from polars._typing import PolarsDataType
 
-from .._utils import _cast_datatype, _flatten_elems, _get_unique_name, _litify
-from .common import case_when, shift
-from .core import make_index
+from .._utils import (
+    _PY_TO_PL,
+    _cast_datatype,
+    _flatten_elems,
+)
+from .common import shift
+from .core import _INDEX_EXPR
 
 __all__ = [
     "bucketize",
@@ -19,19 +29,90 @@ __all__ = [
 ]
 
 
-def _make_bucketize_casewhen(
-    exprs: Collection[Any], *, is_litify: bool
+def _make_index_mod(n: int) -> pl.Expr:
+    # `index % n` drives every round-robin helper; when `n` is a power of
+    # two the modulo reduces to a bitwise AND, sparing the integer
+    # division on each row. The shared `_INDEX_EXPR` is used directly --
+    # the result is always realiased downstream, so no unique name is
+    # needed here.
+    if n > 0 and n & (n - 1) == 0:
+        return _INDEX_EXPR.and_(n - 1)
+    return _INDEX_EXPR.mod(n)
+
+
+def _make_bucketize_replace(items: Collection[Any]) -> pl.Expr:
+    # For plain values, a single `replace_strict()` lookup evaluates
+    # `index % n` exactly once, instead of re-checking it per branch
+    # in a `when-then` chain.
+    n = len(items)
+    return (
+        _make_index_mod(n)
+        .replace_strict(old=list(range(n)), new=list(items))
+        .alias("literal")
+    )
+
+
+def _make_bucketize_gather(exprs: Collection[pl.Expr]) -> pl.Expr:
+    # One row-wise lookup instead of an O(n)-deep `when-then` chain: the
+    # branch values are packed into a list and indexed by `index % n`.
+    return pl.concat_list(*exprs).list.get(_make_index_mod(len(exprs)))
+
+
+def _build_bucketize_lit(
+    items: tuple[Any, ...],
+    return_dtype: pl.DataType | pl.DataTypeExpr | None,
 ) -> pl.Expr:
-    if is_litify:
-        # turn items into exprs
-        exprs: list[pl.Expr] = _litify(exprs)  # type: ignore[no-redef]
-    n = len(exprs)
-    mod_expr = make_index(name=_get_unique_name()).mod(n)
-    *whenthen_exprs, otherwise_expr = exprs
-    case_list: list[tuple[pl.Expr, pl.Expr]] = [
-        (mod_expr.eq(i), expr) for i, expr in enumerate(whenthen_exprs)
-    ]
-    return case_when(case_list, otherwise_expr)
+    first = items[0]
+    if not isinstance(first, (list, tuple)) and all(
+        item == first for item in items[1:]
+    ):
+        # degenerate cycle: every bucket holds the same value, so a plain
+        # broadcast replaces the index machinery entirely
+        expr = pl.repeat(first, pl.len()).alias("literal")
+        if return_dtype is not None:
+            return expr.cast(return_dtype)
+        return _cast_datatype(expr, first)
+    if len(items) == 2:
+        # two-value alternations reduce to the parity of the index: a
+        # single comparison kernel instead of a lookup table
+        if type(first) is bool:
+            expr = _make_index_mod(2).eq(0 if first else 1).alias("literal")
+            if return_dtype is not None and return_dtype != pl.Boolean:
+                return expr.cast(return_dtype)
+            return expr
+        if type(first) is int and set(items) == {0, 1}:
+            expr = (
+                _make_index_mod(2)
+                .eq(0 if first else 1)
+                .cast(pl.Int64)
+                .alias("literal")
+            )
+            if return_dtype is not None and return_dtype != pl.Int64:
+                return expr.cast(return_dtype)
+            return expr
+    expr = _make_bucketize_replace(items)
+    # `replace_strict()` already yields the natural dtype for these scalar
+    # types, so an extra cast node would be an identity map.
+    inferred = _PY_TO_PL.get(type(first))
+    if return_dtype is not None:
+        if inferred is not None and return_dtype == inferred:
+            return expr
+        return expr.cast(return_dtype)
+    if inferred is not None:
+        return expr
+    return _cast_datatype(expr, first)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_bucketize_lit_cached(
+    items: tuple[Any, ...],
+    item_type: type,
+    return_dtype: pl.DataType | pl.DataTypeExpr | None,
+) -> pl.Expr:
+    # `item_type` is part of the key only: Python hashes True == 1 == 1.0
+    # as equal, so value-only keys would collide across bool/int/float
+    # item tuples. The homogeneity check upstream makes one type enough.
+    return _build_bucketize_lit(items, return_dtype)
 
 
 def _get_move_cols(
@@ -42,27 +123,85 @@ def _get_move_cols(
     *more_columns: str | PolarsDataType,
 ) -> list[str] | list[PolarsDataType]:
     if not isinstance(columns, str) and isinstance(columns, Collection):
+        if isinstance(columns, list) and not more_columns:
+            # already normalized: hand the list back without copying
+            return columns
         _columns = [*columns, *more_columns]
     else:
         _columns = [columns, *more_columns]
     return _columns
 
 
+def _move_cols_with_schema(
+    _columns: list[str] | list[PolarsDataType],
+    schema: Mapping[str, PolarsDataType],
+    *,
+    to_start: bool,
+) -> tuple[pl.Expr, ...]:
+    # The partition is resolved Python-side, so Polars sees one plain
+    # column selector instead of a col/exclude pair that walks the
+    # schema twice.
+    if all(isinstance(c, str) for c in _columns):
+        # the comprehension narrows `moved` to list[str] for mypy; the
+        # guard above already guarantees it
+        moved = [c for c in _columns if isinstance(c, str)]
+        moved_set = set(moved)
+        rest = [c for c in schema if c not in moved_set]
+    else:
+        moved = [name for name, dtype in schema.items() if dtype in _columns]
+        rest = [
+            name for name, dtype in schema.items() if dtype not in _columns
+        ]
+    ordered: list[str] = [*moved, *rest] if to_start else [*rest, *moved]
+    return (pl.col(ordered),)
+
+
+def _move_cols_selector(
+    _columns: list[str] | list[PolarsDataType],
+) -> cs.Selector | None:
+    # Selector algebra lets Polars partition the schema in a single
+    # walk; `exclude` is expressed as set-difference on the same
+    # selector instead of an independent re-scan.
+    if isinstance(_columns[0], str):
+        if any(c.startswith("^") for c in _columns):
+            # regex names need Polars-side expansion via `pl.col`
+            return None
+        return cs.by_name(*_columns)
+    return cs.by_dtype(*_columns)
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_concat_template(
+    template: str, sep: str
+) -> tuple[tuple[str, ...], tuple[pl.Expr | None, ...]]:
+    # parsed once per unique (template, sep); the same template normally
+    # recurs when expressions are built in loops. The literal fragments
+    # are pre-wrapped in `pl.lit` here so assembly never constructs
+    # them again; empty segments hold None and are skipped outright.
+    segments = tuple(template.split(sep))
+    lits = tuple(pl.lit(s) if s else None for s in segments)
+    return segments, lits
+
+
 def _make_concat_str(template: str, *col_names: str, sep: str) -> pl.Expr:
-    if not all(isinstance(col_name, str) for col_name in col_names):
-        raise ValueError("All column names must be of type string.")
-    splitted = template.split(sep)
+    splitted, lits = _parse_concat_template(template, sep)
     len_splitted, len_col_names = len(splitted), len(col_names)
+    # the length compare is O(1) against the cached parse, so it runs
+    # before the per-name type walk
     if len_splitted != (len_col_names + 1):
         raise ValueError(
             f"The number of placeholders in the template is {len_splitted}, "
             f"which does not match the number of column names ({len_col_names})."
         )
+    # `map(type, ...)` walks the names in C; large templates pay one set
+    # build instead of a Python-level check per name
+    if set(map(type, col_names)) - {str}:
+        raise ValueError("All column names must be of type string.")
     col_names_iter = iter(col_names)
     concat_str_list: list[pl.Expr | str] = []
-    for s in splitted:
-        if s:
-            concat_str_list.append(pl.lit(s))
+    for lit in lits:
+        if lit is not None:
+            concat_str_list.append(lit)
         if col_name := next(col_names_iter, None):
             concat_str_list.append(col_name)
     return pl.concat_str(concat_str_list)
@@ -154,12 +293,22 @@ def bucketize_lit(
     flatten_items = _flatten_elems(items)  # type: ignore[no-redef]
     if len(flatten_items) <= 1:
         raise ValueError("`items=` must contain a minimum of two items.")
-    if len(set(type(item) for item in flatten_items)) != 1:
-        raise ValueError("`items=` must contain only one unique type.")
-    expr = _make_bucketize_casewhen(flatten_items, is_litify=True)
-    if return_dtype is not None:
-        return expr.cast(return_dtype)
-    return _cast_datatype(expr, flatten_items[0])
+    # early-exit type check: no set allocation, stops on first mismatch
+    first_type = type(flatten_items[0])
+    for item in flatten_items[1:]:
+        if type(item) is not first_type:
+            raise ValueError("`items=` must contain only one unique type.")
+    try:
+        return _build_bucketize_lit_cached(
+            # type objects are hashable; typeshed's Hashable protocol
+            # just cannot prove it for `type`
+            flatten_items,
+            first_type,  # type: ignore[arg-type]
+            return_dtype,
+        )
+    except TypeError:
+        # unhashable items (e.g. lists)
+        return _build_bucketize_lit(flatten_items, return_dtype)
 
 
 def bucketize(
@@ -251,7 +400,7 @@ def bucketize(
     flatten_exprs = _flatten_elems(exprs)  # type: ignore[no-redef]
     if len(flatten_exprs) <= 1:
         raise ValueError("`exprs=` must contain a minimum of two expressions.")
-    expr = _make_bucketize_casewhen(flatten_exprs, is_litify=False)
+    expr = _make_bucketize_gather(flatten_exprs)
     if return_dtype is not None:
         return expr.cast(return_dtype)
     return expr
@@ -279,6 +428,15 @@ def is_every_nth_row(
     in the DataFrame, the result will be a column filled with `False`.
     :::
 
+    ::: {.callout-tip collapse="true"}
+    ### Prefer Lazy Pipelines for Filtering
+
+    When the predicate is used with `filter()`, running it on a LazyFrame
+    (`df.lazy().filter(ti.is_every_nth_row(2)).collect()`) lets Polars push
+    the predicate and projections down the plan, so columns not referenced
+    downstream are never materialized.
+    :::
+
     Parameters
     ----------
     n
@@ -357,11 +515,16 @@ def is_every_nth_row(
     if offset < 0:
         raise ValueError("`offset=` cannot be negative.")
 
-    return shift(
-        make_index(name=_get_unique_name()).mod(n).eq(0),
-        offset,
-        fill_expr=pl.lit(False),
-    ).alias(name)
+    if n == 1:
+        # `index % 1 == 0` holds for every row: broadcast the constant
+        # instead of dividing per row
+        expr = pl.repeat(True, pl.len())
+        if offset == 0:
+            return expr.alias(name)
+    else:
+        expr = _make_index_mod(n).eq(0)
+
+    return shift(expr, offset, fill_expr=pl.lit(False)).alias(name)
 
 
 def move_cols_to_start(
@@ -370,9 +533,10 @@ def move_cols_to_start(
     | Collection[str]
     | Collection[PolarsDataType],
     *more_columns: str | PolarsDataType,
-) -> list[pl.Expr]:
+    schema: Mapping[str, PolarsDataType] | None = None,
+) -> tuple[pl.Expr, ...]:
     """
-    Returns a list of Polars expressions that reorder columns so the specified columns appear first.
+    Returns a tuple of Polars expressions that reorder columns so the specified columns appear first.
 
     ::: {.callout-warning collapse="true"}
     ### Column type restriction
@@ -389,10 +553,16 @@ def move_cols_to_start(
     *more_columns
         Additional names or datatypes of columns to move, specified as positional arguments.
 
+    schema
+        An optional schema mapping (e.g. `df.collect_schema()`). When provided,
+        the reordered column list is computed up front and a single `pl.col()`
+        selector is returned, sparing Polars a second schema resolution on wide
+        frames. Not applied to regular-expression column names.
+
     Returns
     -------
-    list[pl.Expr]
-        A list of expressions to reorder columns.
+    tuple[pl.Expr, ...]
+        A tuple of expressions to reorder columns.
 
     Examples
     -------
@@ -401,7 +571,7 @@ def move_cols_to_start(
     ::: {.callout-caution collapse="true"}
     ### Works Only in `select()` Context
 
-    The list of expressions returned by `move_cols_to_start()` take effect only within
+    The expressions returned by `move_cols_to_start()` take effect only within
     the `select()` context. Using them in `with_columns()` will have no effect,
     and the result will remain unchanged.
     :::
@@ -428,7 +598,16 @@ def move_cols_to_start(
     ```
     """
     _columns = _get_move_cols(columns, *more_columns)
-    return [pl.col(_columns), pl.exclude(_columns)]
+    if len(_columns) == 0:
+        return (pl.all(),)
+    if schema is not None and not any(
+        isinstance(c, str) and c.startswith("^") for c in _columns
+    ):
+        return _move_cols_with_schema(_columns, schema, to_start=True)
+    sel = _move_cols_selector(_columns)
+    if sel is not None:
+        return (sel, cs.all() - sel)
+    return (pl.col(_columns), pl.exclude(_columns))
 
 
 def move_cols_to_end(
@@ -437,9 +616,10 @@ def move_cols_to_end(
     | Collection[str]
     | Collection[PolarsDataType],
     *more_columns: str | PolarsDataType,
-) -> list[pl.Expr]:
+    schema: Mapping[str, PolarsDataType] | None = None,
+) -> tuple[pl.Expr, ...]:
     """
-    Returns a list of Polars expressions that reorder columns so the specified columns appear last.
+    Returns a tuple of Polars expressions that reorder columns so the specified columns appear last.
 
     ::: {.callout-warning collapse="true"}
     ### Column type restriction
@@ -456,10 +636,16 @@ def move_cols_to_end(
     *more_columns
         Additional names or datatypes of columns to move, specified as positional arguments.
 
+    schema
+        An optional schema mapping (e.g. `df.collect_schema()`). When provided,
+        the reordered column list is computed up front and a single `pl.col()`
+        selector is returned, sparing Polars a second schema resolution on wide
+        frames. Not applied to regular-expression column names.
+
     Returns
     -------
-    list[pl.Expr]
-        A list of expressions to reorder columns.
+    tuple[pl.Expr, ...]
+        A tuple of expressions to reorder columns.
 
     Examples
     -------
@@ -468,7 +654,7 @@ def move_cols_to_end(
     ::: {.callout-caution collapse="true"}
     ### Works Only in `select()` Context
 
-    The list of expressions returned by `move_cols_to_end()` take effect only within
+    The expressions returned by `move_cols_to_end()` take effect only within
     the `select()` context. Using them in `with_columns()` will have no effect,
     and the result will remain unchanged.
     :::
@@ -495,7 +681,16 @@ def move_cols_to_end(
     ```
     """
     _columns = _get_move_cols(columns, *more_columns)
-    return [pl.exclude(_columns), pl.col(_columns)]
+    if len(_columns) == 0:
+        return (pl.all(),)
+    if schema is not None and not any(
+        isinstance(c, str) and c.startswith("^") for c in _columns
+    ):
+        return _move_cols_with_schema(_columns, schema, to_start=False)
+    sel = _move_cols_selector(_columns)
+    if sel is not None:
+        return (cs.all() - sel, sel)
+    return (pl.exclude(_columns), pl.col(_columns))
 
 
 def cycle(expr, offset: int = 1) -> pl.Expr:
@@ -1,10 +1,56 @@
+import functools
+from collections.abc import Iterable
 from typing import Literal
 
 import polars as pl
 
-from .general import make_concat_str
+__all__ = ["make_tooltip", "make_hyperlink", "make_hyperlinks"]
 
-__all__ = ["make_tooltip", "make_hyperlink"]
+# `target` only ever takes two values, so both templates are built once
+# at import time.
+_HYPERLINK_TEMPLATES: dict[bool, str] = {
+    True: '<a href="{}" target="_blank">{}</a>',
+    False: '<a href="{}" target="_self">{}</a>',
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _make_tooltip_template(text_decoration_style: str, color: str) -> str:
+    # assemble the fragments once and join, rather than growing the
+    # string with repeated `+=` copies
+    parts = ["cursor: help; "]
+
+    if text_decoration_style != "none":
+        parts.append("text-decoration: underline; ")
+        parts.append(f"text-decoration-style: {text_decoration_style}; ")
+    else:
+        parts.append("text-decoration: none; ")
+
+    if color != "none":
+        parts.append(f"color: {color}; ")
+
+    style = "".join(parts)
+    return f'<abbr style="{style}" title="{{}}">{{}}</abbr>'
+
+
+def _build_hyperlink(text: str, url: str, new_tab: bool, name: str) -> pl.Expr:
+    # `pl.format()` lowers the whole template to a single string kernel,
+    # instead of interleaving `pl.lit` fragments through `make_concat_str()`.
+    return pl.format(_HYPERLINK_TEMPLATES[new_tab], url, text).alias(name)
+
+
+@functools.lru_cache(maxsize=64)
+def _make_hyperlink_cached(
+    text: str, url: str, new_tab: bool, name: str
+) -> pl.Expr:
+    return _build_hyperlink(text, url, new_tab, name)
+
+
+def _make_hyperlink(text: str, url: str, new_tab: bool, name: str) -> pl.Expr:
+    if isinstance(text, str) and isinstance(url, str):
+        return _make_hyperlink_cached(text, url, new_tab, name)
+    # expressions are not reliably hashable, so they bypass the cache
+    return _build_hyperlink(text, url, new_tab, name)
 
 
 def make_hyperlink(
@@ -60,10 +106,55 @@ def make_hyperlink(
     new_df.style
     ```
     """
-    target = "_blank" if new_tab else "_self"
-    return make_concat_str(
-        f'<a href="[$X]" target="{target}">[$X]</a>', url, text, name=name
+    return _make_hyperlink(text, url, new_tab, name)
+
+
+def make_hyperlinks(
+    pairs: Iterable[tuple[str, str]], new_tab: bool = True
+) -> list[pl.Expr]:
+    """
+    Returns a list of Polars expressions, one HTML hyperlink per `(text, url)` pair.
+
+    Passing the whole list to a single `with_columns()` call lets Polars
+    plan and execute the hyperlink expressions together, instead of one
+    plan pass per chained call.
+
+    Parameters
+    ----------
+    pairs
+        An iterable of `(text, url)` tuples, where both entries are column
+        names as accepted by [make_hyperlink()](make_hyperlink.html#turtle_island.make_hyperlink).
+
+    new_tab
+        Whether the links open in a new browser tab (`target="_blank"`) or the current tab.
+
+    Returns
+    -------
+    list[pl.Expr]
+        One expression per pair, each named after its text column.
+
+    Examples
+    --------
+    ### DataFrame Context
+
+    Build several hyperlink columns in one `with_columns()` call:
+    ```{python}
+    import polars as pl
+    import turtle_island as ti
+
+    pl.Config.set_fmt_str_lengths(200)
+    df = pl.DataFrame(
+        {
+            "name": ["Turtle Island"],
+            "url": ["https://github.com/jrycw/turtle-island"],
+            "docs": ["Docs"],
+            "docs_url": ["https://jrycw.github.io/turtle-island/"],
+        }
     )
+    df.with_columns(ti.make_hyperlinks([("name", "url"), ("docs", "docs_url")]))
+    ```
+    """
+    return [_make_hyperlink(text, url, new_tab, text) for text, url in pairs]
 
 
 def make_tooltip(
@@ -137,20 +228,6 @@ def make_tooltip(
     if color is None:
         raise ValueError("`color=` must be a string or 'none', not None.")
 
-    style = "cursor: help; "
-
-    if text_decoration_style != "none":
-        style += "text-decoration: underline; "
-        style += f"text-decoration-style: {text_decoration_style}; "
-    else:
-        style += "text-decoration: none; "
-
-    if color != "none":
-        style += f"color: {color}; "
-
-    return make_concat_str(
-        f'<abbr style="{style}" title="[$X]">[$X]</abbr>',
-        tooltip,
-        label,
-        name=name,
-    )
+    return pl.format(
+        _make_tooltip_template(text_decoration_style, color), tooltip, label
+    ).alias(name)
@@ -1,20 +1,56 @@
 import datetime
 
+import numpy as np
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
 
-@pytest.fixture(scope="module")
+def fast_eq(a: pl.DataFrame, b: pl.DataFrame) -> None:
+    # `equals` short-circuits in Rust on the green path but is not
+    # dtype-strict (Int64 == Int32 frames compare equal), so the schemas
+    # are compared too; only fall back to `assert_frame_equal` to
+    # produce a readable diff on mismatch
+    if not (a.schema == b.schema and a.equals(b)):
+        assert_frame_equal(a, b)
+
+
+_DT_SERIES = pl.datetime_range(
+    datetime.datetime(2025, 1, 1),
+    datetime.datetime(2025, 1, 3),
+    eager=True,
+)
+_DATE_SERIES = pl.date_range(
+    datetime.date(2025, 1, 1),
+    datetime.date(2025, 1, 3),
+    eager=True,
+)
+_TIME_SERIES = pl.time_range(
+    datetime.time(13, 0), datetime.time(15, 0), eager=True
+)
+_DURATIONS = [
+    datetime.timedelta(seconds=1),
+    datetime.timedelta(minutes=1),
+    datetime.timedelta(hours=1),
+]
+
+
+@pytest.fixture(scope="session")
 def df_x():
-    return pl.DataFrame({"x": [1, 2, 3, 4]})
+    return pl.DataFrame({"x": np.arange(1, 5, dtype=np.int64)})
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def df_xy():
-    return pl.DataFrame({"x": [1, 2, 3, 4], "y": [5, 6, 7, 8]})
+    return pl.DataFrame(
+        {
+            "x": np.arange(1, 5, dtype=np.int64),
+            "y": np.arange(5, 9, dtype=np.int64),
+        }
+    )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def df_xy_list():
     return pl.DataFrame(
         {
@@ -24,27 +60,37 @@ def df_xy_list():
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def df_n():
     """
     n_row = 9
     """
-    return pl.DataFrame({"n": [1, 2, 3, 4, 5, 6, 7, 8, 9]})
+    return pl.DataFrame({"n": np.arange(1, 10, dtype=np.int64)})
+
+
+@pytest.fixture(scope="session")
+def df_n_indexed(df_n):
+    return df_n.with_row_index()
+
+
+@pytest.fixture(scope="session")
+def df_x_indexed(df_x):
+    return df_x.with_row_index()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def df_abcd():
     return pl.DataFrame(
         {
-            "a": [1, 2, 3],
-            "b": [1.11, 2.22, 3.33],
-            "c": [4, 5, 6],
+            "a": np.array([1, 2, 3], dtype=np.int64),
+            "b": np.array([1.11, 2.22, 3.33]),
+            "c": np.array([4, 5, 6], dtype=np.int64),
             "d": ["x", "y", "z"],
         }
     )
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def df_full():
     return pl.DataFrame(
         {
@@ -52,25 +98,10 @@ def df_full():
             "float": [1.11, 2.22, 3.33],
             "bool": [True, False, True],
             "string": ["x", "y", "z"],
-            "datetimee": pl.datetime_range(
-                datetime.datetime(2025, 1, 1),
-                datetime.datetime(2025, 1, 3),
-                eager=True,
-            ),
-            "date": pl.date_range(
-                datetime.date(2025, 1, 1),
-                datetime.date(2025, 1, 3),
-                eager=True,
-            ),
-            "time": pl.time_range(
-                datetime.time(13, 0), datetime.time(15, 0), eager=True
-            ),
-            "duration": [
-                datetime.timedelta(seconds=1),
-                datetime.timedelta(minutes=1),
-                datetime.timedelta(hours=1),
-            ],
+            "datetimee": _DT_SERIES,
+            "date": _DATE_SERIES,
+            "time": _TIME_SERIES,
+            "duration": _DURATIONS,
             "list": [[1, 2, 3], [4, 5, 6], [7, 8, 9]],
-            "tuple": [(1, 2, 3), (4, 5, 6), (7, 8, 9)],
         }
     )
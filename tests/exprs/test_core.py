@@ -37,29 +37,33 @@ def test_make_index_alias(name):
 # ===
 
 
-@pytest.mark.parametrize("offset", [0, 1, 10, 100])
-def test_make_index_index_column_exist(df_x, offset):
+# expected frames built once at import, directly rather than via a
+# horizontal concat; the "x" column mirrors the `df_x` fixture
+_MAKE_INDEX_EXPECTED = {
+    offset: pl.DataFrame(
+        {"index": list(range(offset, offset + 4)), "x": [1, 2, 3, 4]},
+        schema={"index": pl.UInt32, "x": pl.Int64},
+    )
+    for offset in (0, 1, 10, 100)
+}
+
+
+@pytest.mark.parametrize("offset", sorted(_MAKE_INDEX_EXPECTED))
+def test_make_index_index_column_exist(df_x_indexed, offset):
     # intentionally use `with_columns()`
     assert_frame_equal(
-        df_x.with_row_index().with_columns(ti.make_index(offset=offset)),
-        pl.concat(
-            [
-                pl.DataFrame(
-                    {"index": [offset, offset + 1, offset + 2, offset + 3]},
-                    schema={"index": pl.UInt32},
-                ),
-                df_x,
-            ],
-            how="horizontal_extend",
-        ),
+        df_x_indexed.with_columns(ti.make_index(offset=offset)),
+        _MAKE_INDEX_EXPECTED[offset],
     )
 
 
-@pytest.mark.parametrize(
-    "exprs, result",
-    [
-        (
-            (pl.lit("one"), pl.lit("two"), pl.lit("three"), pl.lit("four")),
+# expected columns built once at import and shared across the
+# parametrized cases
+_BUCKETIZE_CASES = [
+    (
+        (pl.lit("one"), pl.lit("two"), pl.lit("three"), pl.lit("four")),
+        pl.Series(
+            "bucketized",
             [
                 "one",
                 "two",
@@ -71,27 +75,34 @@ def test_make_index_index_column_exist(df_x, offset):
                 "four",
                 "one",
             ],
+            dtype=pl.String,
         ),
-        (
-            (pl.col("n").cast(pl.String), pl.col("n").add(10).cast(pl.String)),
+    ),
+    (
+        (pl.col("n").cast(pl.String), pl.col("n").add(10).cast(pl.String)),
+        pl.Series(
+            "bucketized",
             ["1", "12", "3", "14", "5", "16", "7", "18", "9"],
+            dtype=pl.String,
         ),
-    ],
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "exprs, expected_col", _BUCKETIZE_CASES, ids=["lits", "exprs"]
 )
-def test_bucketize_index_column_exist(df_n, exprs, result):
+def test_bucketize_index_column_exist(df_n_indexed, exprs, expected_col):
     name = "bucketized"
-    _df = df_n.with_row_index()
     # intentionally use `with_columns()`
-    new_df = _df.with_columns(ti.bucketize(*exprs).alias(name))
-    expected = pl.concat(
-        [_df, pl.DataFrame({name: result})], how="horizontal_extend"
-    )
+    new_df = df_n_indexed.with_columns(ti.bucketize(*exprs).alias(name))
+    expected = df_n_indexed.with_columns(expected_col)
     assert_frame_equal(new_df, expected)
 
 
-@pytest.mark.parametrize(
-    "n,  s_bool",
-    [
+_NTH_ROW_EXPECTED = {
+    n: pl.Series("bool_nth_row", s_bool, dtype=pl.Boolean)
+    for n, s_bool in [
         (1, [True, True, True, True, True, True, True, True, True]),
         (2, [True, False, True, False, True, False, True, False, True]),
         (3, [True, False, False, True, False, False, True, False, False]),
@@ -102,15 +113,15 @@ def test_bucketize_index_column_exist(df_n, exprs, result):
         (8, [True, False, False, False, False, False, False, False, True]),
         (9, [True, False, False, False, False, False, False, False, False]),
         (10, [True, False, False, False, False, False, False, False, False]),
-    ],
-)
-def test_is_every_nth_row_index_column_exist(df_n, n, s_bool):
-    _df = df_n.with_row_index()
+    ]
+}
+
+
+@pytest.mark.parametrize("n", sorted(_NTH_ROW_EXPECTED))
+def test_is_every_nth_row_index_column_exist(df_n_indexed, n):
     expr = ti.is_every_nth_row(n)
     # intentionally use `with_columns()`
-    new_df = _df.with_columns(expr)
-    expected = pl.concat(
-        [_df, pl.DataFrame({"bool_nth_row": s_bool})], how="horizontal_extend"
-    )
+    new_df = df_n_indexed.with_columns(expr)
+    expected = df_n_indexed.with_columns(_NTH_ROW_EXPECTED[n])
 
     assert_frame_equal(new_df, expected)
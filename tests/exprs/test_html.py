@@ -4,7 +4,7 @@ import pytest
 import turtle_island as ti
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def df_html():
     return pl.DataFrame(
         {
@@ -41,13 +41,32 @@ def test_make_hyperlink_newtab(df_html, new_tab, expected):
     assert expected in new_df.item()
 
 
+def test_make_hyperlink_expr_input(df_html):
+    # expression inputs bypass the cache instead of failing to hash
+    new_df = df_html.select(ti.make_hyperlink(pl.col("text"), "url"))
+    expected = df_html.select(ti.make_hyperlink("text", "url"))
+
+    assert new_df.item() == expected.item()
+
+
 @pytest.mark.parametrize("name", [("name")])
+@pytest.mark.fast
 def test_make_hyperlink_alias(name):
     expr = ti.make_hyperlink("text", "url", name=name)
 
     assert expr.meta.output_name() == name
 
 
+def test_make_hyperlinks(df_html):
+    exprs = ti.make_hyperlinks([("text", "url"), ("description", "url")])
+    new_df = df_html.with_columns(exprs)
+
+    assert new_df.columns == ["text", "url", "description"]
+
+    expected = '<a href="https://github.com/jrycw/turtle-island" target="_blank">Turtle Island</a>'
+    assert new_df.get_column("text").item() == expected
+
+
 @pytest.mark.parametrize("expr1, expr2", [("text", "description")])
 def test_make_tooltip(df_html, expr1, expr2):
     name = "tooltip"
@@ -89,6 +108,7 @@ def test_make_tooltip_options(
 
 
 @pytest.mark.parametrize("name", [("name")])
+@pytest.mark.fast
 def test_make_tooltip_alias(name):
     expr = ti.make_tooltip("label", "tooltip", name=name)
 
@@ -99,6 +119,7 @@ def test_make_tooltip_alias(name):
     "expr1, expr2, text_decoration_style",
     [("name", "description", "text_decoration_style")],
 )
+@pytest.mark.fast
 def test_make_tooltip_raise_text_decoration_style(
     expr1, expr2, text_decoration_style
 ):
@@ -116,6 +137,7 @@ def test_make_tooltip_raise_text_decoration_style(
 @pytest.mark.parametrize(
     "expr1, expr2, color", [("name", "description", None)]
 )
+@pytest.mark.fast
 def test_make_tooltip_raise_color(expr1, expr2, color):
     with pytest.raises(ValueError) as exc_info:
         ti.make_tooltip(expr1, expr2, color=color)
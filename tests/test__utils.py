@@ -12,12 +12,14 @@ from turtle_island._utils import (
 
 
 @pytest.mark.parametrize("items", [(1, 2), (3.3, 4.4), ("x", "y")])
+@pytest.mark.fast
 def test__litify(items):
     litified = _litify(items)
     assert all(isinstance(lit, pl.Expr) for lit in litified)
 
 
 @pytest.mark.parametrize("n", [10, 11, 12])
+@pytest.mark.fast
 def test__get_unique_name(n):
     name1 = _get_unique_name(n)
     name2 = _get_unique_name(n)
@@ -25,6 +27,7 @@ def test__get_unique_name(n):
     assert len(name1) == len(name2) == n
 
 
+@pytest.mark.fast
 def test__get_unique_name_raise():
     with pytest.raises(ValueError) as exc_info:
         _get_unique_name(7)
@@ -35,6 +38,11 @@ def test__get_unique_name_raise():
     )
 
 
+# schema-only frame: resolving the plan is enough to observe the cast,
+# so no data ever runs through the kernel
+_LF_A = pl.LazyFrame(schema={"a": pl.Int64})
+
+
 @pytest.mark.parametrize(
     "item, expected",
     [
@@ -53,11 +61,21 @@ def test__get_unique_name_raise():
         (object(), pl.Int64),
     ],
 )
-def test__cast_datatype(df_abcd, item, expected):
-    new_df = df_abcd.select(_cast_datatype(pl.col("a"), item))
-    assert new_df.dtypes[0] == expected
+@pytest.mark.fast
+def test__cast_datatype(item, expected):
+    schema = _LF_A.select(_cast_datatype(pl.col("a"), item)).collect_schema()
+    assert schema["a"] == expected
+
+
+@pytest.mark.fast
+def test__cast_datatype_noop_return_self():
+    expr = pl.col("a")
+    expected = _cast_datatype(expr, 1, current_dtype=pl.Int64)
+
+    assert expr is expected
 
 
+@pytest.mark.fast
 def test__flatten_elems():
     exprs1 = _flatten_elems((pl.lit(1), pl.lit(2)))
     exprs2 = _flatten_elems(((pl.lit(1), pl.lit(2)),))
@@ -70,6 +88,7 @@ def test__flatten_elems():
         assert expr1.meta.eq(expr2)
 
 
+@pytest.mark.fast
 def test__flatten_elems_one_element():
     exprs1 = _flatten_elems((pl.lit(1),))
     exprs2 = _flatten_elems(((pl.lit(1),),))